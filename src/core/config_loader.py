@@ -9,6 +9,12 @@ from pathlib import Path
 from typing import List, Dict, Any
 from dataclasses import dataclass
 
+# libyaml付きビルドならCローダーを使用（純Python実装より5〜10倍高速）
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 @dataclass
 class PresetMeta:
@@ -63,7 +69,8 @@ class ConfigLoader:
 
         try:
             with open(config_path, 'r', encoding='utf-8') as f:
-                config = yaml.safe_load(f)
+                # 一括読み込みした文字列を渡す方がファイルオブジェクトより高速
+                config = yaml.load(f.read(), Loader=_YamlLoader)
         except yaml.YAMLError as e:
             raise yaml.YAMLError(f"YAML形式が不正です: {e}")
 
@@ -3,13 +3,121 @@
 ファイルのスキャンとフィルタリング
 """
 
+import fnmatch
+import functools
+import os
+import re
+import struct
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
-from typing import List, Dict, Any
+from typing import Iterator, List, Dict, Any, Tuple
 from PIL import Image
 
 from ..utils.file_utils import parse_file_size
 
+# 大量ファイルのサイズ・日付判定をベクトル化するためのオプション依存
+# （未導入でも純Pythonパスで動作する）
+try:
+    import numpy as _np
+except ImportError:
+    _np = None
+
+# フィルタ判定用スレッド数（stat/画像ヘッダ読みはI/Oバウンド）
+_MAX_FILTER_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# これ以上のファイル数ならNumPyベクトル化パスを使う
+_VECTORIZE_MIN_FILES = 1024
+
+# 同時に開く画像ファイル数の上限（FD枯渇防止）
+_IMAGE_OPEN_SEMAPHORE = threading.Semaphore(128)
+
+
+def _fast_image_size(path) -> 'Tuple[int, int] | None':
+    """
+    PNGヘッダから直接サイズを読む（PILを起動しない高速パス）
+
+    PNGは先頭8バイトのシグネチャ直後にIHDRチャンクが来ることが
+    保証されており、オフセット16から幅・高さがビッグエンディアンで
+    並ぶ。24バイトのreadとstruct.unpackだけで判定できる。
+    JPEG等はEXIF回転の考慮が必要なためPIL側に任せる。
+
+    Args:
+        path: 画像ファイルのパス
+
+    Returns:
+        (幅, 高さ)、PNG以外・解析失敗時はNone
+    """
+    try:
+        with open(path, 'rb') as f:
+            head = f.read(24)
+    except OSError:
+        return None
+
+    if head.startswith(b'\x89PNG\r\n\x1a\n') and head[12:16] == b'IHDR':
+        width, height = struct.unpack('>II', head[16:24])
+        return width, height
+
+    return None
+
+
+# Windowsのglob/Path.matchは大文字小文字を区別しないため、
+# 正規表現化したパターンにも同じプラットフォーム既定を適用する
+# （*.jpg が IMG_0001.JPG にマッチしなくなるのを防ぐ）
+_GLOB_FLAGS = re.IGNORECASE if os.name == 'nt' else 0
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_glob(pattern: str) -> 're.Pattern':
+    """ワイルドカードパターンを正規表現にコンパイル（メモ化）"""
+    return re.compile(fnmatch.translate(pattern), _GLOB_FLAGS)
+
+
+def _iter_files(root: Path, pattern: str, recursive: bool) -> Iterator[Path]:
+    """
+    os.scandirベースのファイル列挙
+
+    pathlibのglob/rglobと違い、DirEntryのキャッシュ済みメタデータで
+    is_file判定できるため余分なstatが発生しない。パターンは
+    fnmatch.translateで正規表現に1回だけコンパイルして使い回す。
+
+    Args:
+        root: 走査起点ディレクトリ
+        pattern: ファイル名パターン（ワイルドカード可）
+        recursive: サブディレクトリも走査するか
+
+    Yields:
+        マッチしたファイルのPath
+    """
+    # ディレクトリ区切りを含むパターンはpathlibのglobに任せる
+    if os.sep in pattern or '/' in pattern:
+        if recursive:
+            yield from (f for f in root.rglob(pattern) if f.is_file())
+        else:
+            yield from (f for f in root.glob(pattern) if f.is_file())
+        return
+
+    match = _compile_glob(pattern).match
+
+    # 再帰呼び出しではなくスタックで走査（深いツリーでも安全）
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(entry.path)
+                        elif match(entry.name) and entry.is_file():
+                            yield Path(entry.path)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
 
 class FileScanner:
     """
@@ -31,8 +139,18 @@ class FileScanner:
         Args:
             target_directory: スキャン対象ディレクトリ（文字列またはリスト）
             logger: ロガー
+
+        Raises:
+            FileNotFoundError: 有効なディレクトリが1つもない
         """
         self.logger = logger
+        self.skipped_dirs = []
+
+        # 除外パターンのコンパイル結果キャッシュ（パターン組→マッチャー）
+        self._excl_cache = {}
+
+        # 画像サイズのキャッシュ（同一ファイルの再オープン回避）
+        self._size_cache: Dict[Path, Tuple[int, int]] = {}
 
         # 文字列でもリストでも受け取れるように正規化
         if isinstance(target_directory, list):
@@ -42,7 +160,6 @@ class FileScanner:
 
         # 存在チェック & 警告
         self.valid_dirs = []
-        self.skipped_dirs = []
 
         for directory in self.target_directories:
             if directory.exists():
@@ -57,6 +174,41 @@ class FileScanner:
             dirs_str = ", ".join(str(d) for d in self.target_directories)
             raise FileNotFoundError(f"有効なディレクトリが見つかりません: {dirs_str}")
 
+    def _image_size(self, file: Path) -> Tuple[int, int]:
+        """
+        画像の(幅, 高さ)を取得（結果はキャッシュ）
+
+        EXIFの回転指定5〜8は縦横が入れ替わるため、
+        transpose（ピクセル変換）はせず数値だけ交換して返す。
+
+        Args:
+            file: 画像ファイルのパス
+
+        Returns:
+            (幅, 高さ) のタプル
+
+        Raises:
+            画像として開けない場合はPIL由来の例外
+        """
+        size = self._size_cache.get(file)
+        if size is None:
+            # PNGはヘッダ直読みの高速パス（PILオブジェクトを構築しない）
+            size = _fast_image_size(file)
+
+            if size is None:
+                with _IMAGE_OPEN_SEMAPHORE, Image.open(file) as img:
+                    width, height = img.size
+                    orientation = img.getexif().get(274)
+
+                if orientation in (5, 6, 7, 8):
+                    width, height = height, width
+
+                size = (width, height)
+
+            self._size_cache[file] = size
+
+        return size
+
     def scan_files(
         self,
         pattern: str,
@@ -79,259 +231,489 @@ class FileScanner:
         filters = filters or {}
         exclusions = exclusions or {'exact_names': [], 'patterns': []}
 
-        # 複数ディレクトリをまとめてスキャン
-        all_matched_files = []
+        # 列挙→除外→フィルタをジェネレータで連結し、
+        # 中間リストを作らずに最後の境界でのみ実体化する
+        matched = self._iter_matched(pattern, recursive)
+        matched = self._apply_exclusions(matched, exclusions)
+
+        if filters:
+            matched = self._apply_filters(matched, filters)
+
+        return list(matched)
+
+    def iter_files(
+        self,
+        pattern: str = '*',
+        recursive: bool = False
+    ) -> Iterator[Path]:
+        """
+        パターンにマッチするファイルを遅延列挙
+
+        scan_filesと違いリストを実体化しないため、全ファイルを
+        1件ずつ処理する呼び出し側（クリーンアップ計画など）向け
+
+        Args:
+            pattern: ファイル名パターン（ワイルドカード可）
+            recursive: サブディレクトリも検索するか
+
+        Returns:
+            マッチしたファイルのイテレータ
+        """
+        return self._iter_matched(pattern, recursive)
+
+    def _iter_matched(self, pattern: str, recursive: bool) -> Iterator[Path]:
+        """全対象ディレクトリからパターンにマッチするファイルを遅延列挙"""
         for target_dir in self.valid_dirs:
-            # パターンマッチングでファイル取得
-            if recursive:
-                matched_files = list(target_dir.rglob(pattern))
+            yield from _iter_files(target_dir, pattern, recursive)
+
+    def scan_files_multi(
+        self,
+        rules: List[Tuple[str, Dict[str, Any]]],
+        exclusions: Dict[str, List[str]] = None,
+        recursive: bool = False
+    ) -> Iterator[Tuple[int, Path]]:
+        """
+        複数ルールを1回のディレクトリ走査でマッチング
+
+        ルールごとにscan_filesを呼ぶとディレクトリをルール数だけ
+        再走査してしまう。ここでは1回の走査で各ファイルを
+        ルール定義順に照合し、パターンが一致してもフィルタで
+        弾かれた場合は後続ルールを順に試す（従来のルールごと
+        スキャンと同じ優先順位の挙動）。
+
+        Args:
+            rules: (パターン, フィルタ条件) のリスト（優先順）
+            exclusions: 除外条件（exact_names, patterns）
+            recursive: サブディレクトリも検索するか
+
+        Yields:
+            (マッチしたルールのインデックス, ファイルパス)
+        """
+        exclusions = exclusions or {'exact_names': [], 'patterns': []}
+
+        # パターンとしきい値はループ外で1回だけコンパイル・パース
+        # ディレクトリ区切りを含むパターンはファイル名だけでは判定できない
+        # ため、従来どおりpathlib系の列挙でマッチ集合を作って照合する
+        matchers = []
+        sep_matched_sets = []
+        for pattern, filters in rules:
+            filters = filters or {}
+            bounds = self._parse_stat_bounds(filters)
+
+            if os.sep in pattern or '/' in pattern:
+                matched_set = frozenset(self._iter_matched(pattern, recursive))
+                sep_matched_sets.append(matched_set)
+                matchers.append(
+                    (matched_set.__contains__, True, filters, bounds)
+                )
             else:
-                matched_files = list(target_dir.glob(pattern))
+                matchers.append(
+                    (_compile_glob(pattern).match, False, filters, bounds)
+                )
 
-            # ディレクトリを除外（ファイルのみ）
-            matched_files = [f for f in matched_files if f.is_file()]
-            all_matched_files.extend(matched_files)
+        primary = self._apply_exclusions(
+            self._iter_matched('*', recursive), exclusions
+        )
 
-        # 除外パターンの適用
-        all_matched_files = self._apply_exclusions(all_matched_files, exclusions)
+        # 区切り付きルールの対象（非再帰時のサブディレクトリ内など）は
+        # '*'走査に現れないことがあるため、列挙に補完する
+        if sep_matched_sets:
+            candidates = self._chain_unique(primary, sep_matched_sets, exclusions)
+        else:
+            candidates = ((file, False) for file in primary)
 
-        # フィルタの適用
-        if filters:
-            all_matched_files = self._apply_filters(all_matched_files, filters)
+        for file, supplemental in candidates:
+            name = file.name
+            st = None
+
+            for rule_idx, (match, on_path, filters, bounds) in enumerate(matchers):
+                # 補完分は'*'走査に現れなかったファイル。ファイル名だけの
+                # ルールは従来のルールごとスキャンでも照合対象にならなかった
+                # ため、パス照合するルールのみ試す
+                if supplemental and not on_path:
+                    continue
+
+                if not match(file if on_path else name):
+                    continue
+
+                if filters:
+                    # statはファイルごとに1回だけ（複数ルールで共有）
+                    if st is None:
+                        st = file.stat()
+                    if not self._check_file_filters(file, st, filters, bounds):
+                        continue
 
-        return all_matched_files
+                yield rule_idx, file
+                break
+
+    def _chain_unique(
+        self,
+        primary: Iterator[Path],
+        extra_sets: List[frozenset],
+        exclusions: Dict[str, List[str]]
+    ) -> 'Iterator[Tuple[Path, bool]]':
+        """
+        主列挙に現れなかったパスを重複なく補完して列挙
+
+        Yields:
+            (ファイルパス, 補完分ならTrue) のタプル
+        """
+        seen = set()
+        for file in primary:
+            seen.add(file)
+            yield file, False
+
+        def _iter_extras():
+            for extra in extra_sets:
+                for file in sorted(extra):
+                    if file not in seen:
+                        seen.add(file)
+                        yield file
+
+        for file in self._apply_exclusions(_iter_extras(), exclusions):
+            yield file, True
 
     def _apply_exclusions(
         self,
-        files: List[Path],
+        files: 'Iterator[Path]',
         exclusions: Dict[str, List[str]]
-    ) -> List[Path]:
+    ) -> Iterator[Path]:
         """
-        除外パターンを適用
+        除外パターンを適用（遅延評価）
 
         Args:
-            files: ファイルリスト
+            files: ファイルのイテレータ
             exclusions: 除外条件
 
-        Returns:
-            除外後のファイルリスト
+        Yields:
+            除外されなかったファイル
         """
-        exact_names = exclusions.get('exact_names', [])
-        patterns = exclusions.get('patterns', [])
+        # 完全一致名はsetにしてO(1)照合（リストだとファイル数×名前数の線形探索）
+        exact_names = frozenset(exclusions.get('exact_names', []))
+
+        # パターン群は1つの正規表現に結合してコンパイル（呼び出し間でキャッシュ）
+        excl_match = self._get_exclusion_matcher(tuple(exclusions.get('patterns', [])))
 
-        filtered_files = []
         for file in files:
             # 完全一致での除外
             if file.name in exact_names:
                 continue
 
-            # パターンでの除外
-            excluded = False
-            for pattern in patterns:
-                if file.match(pattern):
-                    excluded = True
-                    break
-
-            if not excluded:
-                filtered_files.append(file)
+            # パターンでの除外（名前は結合済み正規表現、区切り付きはPath.match）
+            if excl_match is not None and excl_match(file):
+                continue
 
-        return filtered_files
+            yield file
 
-    def _apply_filters(
-        self,
-        files: List[Path],
-        filters: Dict[str, Any]
-    ) -> List[Path]:
+    def _get_exclusion_matcher(self, patterns: tuple):
         """
-        フィルタを適用
+        除外パターン群を判定するマッチャーを取得
+
+        Path.matchはパターンを呼び出しごとに再パースするため、
+        ファイル名だけのパターンはfnmatch.translateで1回だけ
+        コンパイルして使い回す。区切りを含むパターンはファイル名
+        では判定できないため、従来どおりPath.matchでパス末尾と
+        照合する。
 
         Args:
-            files: ファイルリスト
-            filters: フィルタ条件
+            patterns: 除外パターンのタプル
 
         Returns:
-            フィルタ後のファイルリスト
+            Pathを受け取り除外対象ならTrueを返す関数、パターンがなければNone
         """
-        filtered_files = []
+        if not patterns:
+            return None
 
-        for file in files:
-            # 全てのフィルタをパスする必要がある（AND条件）
-            if self._check_file_filters(file, filters):
-                filtered_files.append(file)
+        matcher = self._excl_cache.get(patterns)
+        if matcher is None:
+            name_patterns = []
+            sep_patterns = []
+            for pattern in patterns:
+                if os.sep in pattern or '/' in pattern:
+                    sep_patterns.append(pattern)
+                else:
+                    name_patterns.append(pattern)
+
+            # Path.match同様、Windowsでは大文字小文字を区別しない
+            name_match = (
+                re.compile(
+                    '|'.join(f'(?:{fnmatch.translate(p)})' for p in name_patterns),
+                    _GLOB_FLAGS
+                ).match
+                if name_patterns else None
+            )
 
-        return filtered_files
+            def matcher(file: Path) -> bool:
+                if name_match is not None and name_match(file.name):
+                    return True
+                return any(file.match(p) for p in sep_patterns)
 
-    def _check_file_filters(self, file: Path, filters: Dict[str, Any]) -> bool:
+            self._excl_cache[patterns] = matcher
+
+        return matcher
+
+    def _apply_filters(
+        self,
+        files: 'Iterator[Path]',
+        filters: Dict[str, Any]
+    ) -> Iterator[Path]:
         """
-        ファイルが全フィルタ条件を満たすか確認
+        フィルタを適用（遅延評価）
+
+        stat・画像ヘッダ読みはI/Oバウンドのため、スレッドプールで
+        並列に判定する（結果は入力順を維持）。stat並列化と
+        ベクトル化の判定に件数が必要なため、入力はここで一度だけ
+        実体化する（列挙・除外段の中間リストは作られない）。
 
         Args:
-            file: ファイルパス
+            files: ファイルのイテレータ
             filters: フィルタ条件
 
-        Returns:
-            全条件を満たす場合True
+        Yields:
+            全フィルタを通過したファイル
         """
-        # サイズフィルタ
-        if 'size' in filters:
-            if not self._check_size_filter(file, filters['size']):
-                return False
-
-        # 日付フィルタ
-        if 'date' in filters:
-            if not self._check_date_filter(file, filters['date']):
-                return False
-
-        # 解像度フィルタ
-        if 'resolution' in filters:
-            if not self._check_resolution_filter(file, filters['resolution']):
-                return False
-
-        # アスペクト比フィルタ
-        if 'aspect_ratio' in filters:
-            if not self._check_aspect_ratio_filter(file, filters['aspect_ratio']):
-                return False
-
-        return True
-
-    def _check_size_filter(self, file: Path, size_filter: Dict[str, Any]) -> bool:
+        files = list(files)
+
+        # 大量ファイル＆NumPyあり: サイズ・日付はC実装の配列演算で一括判定
+        if (
+            _np is not None
+            and len(files) >= _VECTORIZE_MIN_FILES
+            and ('size' in filters or 'date' in filters)
+        ):
+            files = self._apply_stat_filters_vectorized(files, filters)
+
+            # 画像系フィルタが残っていなければここで確定
+            filters = {
+                k: v for k, v in filters.items()
+                if k in ('resolution', 'aspect_ratio')
+            }
+            if not filters:
+                yield from files
+                return
+
+        # しきい値のパースはループ外で1回だけ（ループ不変式の持ち上げ）
+        bounds = self._parse_stat_bounds(filters)
+
+        # statは1ファイルにつき1回だけ発行し、各フィルタで結果を共有する
+        # 少数ならスレッド起動コストの方が高いので直列処理
+        if len(files) <= 1:
+            for file in files:
+                if self._check_file_filters(file, file.stat(), filters, bounds):
+                    yield file
+            return
+
+        # 全てのフィルタをパスする必要がある（AND条件）
+        with ThreadPoolExecutor(max_workers=_MAX_FILTER_WORKERS) as executor:
+            results = executor.map(
+                lambda f: self._check_file_filters(f, f.stat(), filters, bounds),
+                files
+            )
+            for file, ok in zip(files, results):
+                if ok:
+                    yield file
+
+    @staticmethod
+    def _parse_stat_bounds(filters: Dict[str, Any]) -> Tuple:
         """
-        サイズフィルタのチェック
+        サイズ・日付フィルタのしきい値を数値に変換
+
+        ファイルごとにparse_file_size/strptimeを呼ばずに済むよう、
+        フィルタ辞書から1回だけパースして比較用の数値にしておく。
 
         Args:
-            file: ファイルパス
-            size_filter: サイズフィルタ条件（min, max）
+            filters: フィルタ条件
 
         Returns:
-            条件を満たす場合True
+            (min_size, max_size, after_ts, before_ts)、未指定はNone
         """
-        file_size = file.stat().st_size
-
-        if 'min' in size_filter:
-            min_size = parse_file_size(size_filter['min'])
-            if file_size < min_size:
-                return False
-
-        if 'max' in size_filter:
-            max_size = parse_file_size(size_filter['max'])
-            if file_size > max_size:
-                return False
-
-        return True
-
-    def _check_date_filter(self, file: Path, date_filter: Dict[str, str]) -> bool:
+        size_filter = filters.get('size', {})
+        min_size = (
+            parse_file_size(size_filter['min']) if 'min' in size_filter else None
+        )
+        max_size = (
+            parse_file_size(size_filter['max']) if 'max' in size_filter else None
+        )
+
+        date_filter = filters.get('date', {})
+        after_ts = (
+            datetime.strptime(date_filter['after'], '%Y-%m-%d').timestamp()
+            if 'after' in date_filter else None
+        )
+        before_ts = (
+            datetime.strptime(date_filter['before'], '%Y-%m-%d').timestamp()
+            if 'before' in date_filter else None
+        )
+
+        return min_size, max_size, after_ts, before_ts
+
+    def _apply_stat_filters_vectorized(
+        self,
+        files: List[Path],
+        filters: Dict[str, Any]
+    ) -> List[Path]:
         """
-        日付フィルタのチェック
+        サイズ・日付フィルタをNumPyの配列演算で一括判定
+
+        statをスレッドプールで並列取得した後、st_size/st_mtimeを
+        int64/float64配列に詰めてC実装の比較演算1回でマスクを作る。
+        ファイルごとのPythonループが消えるため、10万件規模でも
+        CPU側のコストはミリ秒オーダーに収まる。
 
         Args:
-            file: ファイルパス
-            date_filter: 日付フィルタ条件（after, before）
+            files: ファイルリスト
+            filters: フィルタ条件（sizeとdateのみ参照）
 
         Returns:
-            条件を満たす場合True
+            サイズ・日付条件を満たしたファイルのリスト（入力順を維持）
         """
-        file_mtime = datetime.fromtimestamp(file.stat().st_mtime)
-
-        if 'after' in date_filter:
-            after_date = datetime.strptime(date_filter['after'], '%Y-%m-%d')
-            if file_mtime < after_date:
-                return False
-
-        if 'before' in date_filter:
-            before_date = datetime.strptime(date_filter['before'], '%Y-%m-%d')
-            if file_mtime >= before_date:
-                return False
-
-        return True
-
-    def _check_resolution_filter(
+        n = len(files)
+
+        with ThreadPoolExecutor(max_workers=_MAX_FILTER_WORKERS) as executor:
+            stats = list(executor.map(lambda f: f.stat(), files))
+
+        mask = _np.ones(n, dtype=bool)
+
+        size_filter = filters.get('size')
+        if size_filter:
+            sizes = _np.fromiter(
+                (st.st_size for st in stats), dtype=_np.int64, count=n
+            )
+            if 'min' in size_filter:
+                mask &= sizes >= parse_file_size(size_filter['min'])
+            if 'max' in size_filter:
+                mask &= sizes <= parse_file_size(size_filter['max'])
+
+        date_filter = filters.get('date')
+        if date_filter:
+            mtimes = _np.fromiter(
+                (st.st_mtime for st in stats), dtype=_np.float64, count=n
+            )
+            if 'after' in date_filter:
+                after_ts = datetime.strptime(
+                    date_filter['after'], '%Y-%m-%d'
+                ).timestamp()
+                mask &= mtimes >= after_ts
+            if 'before' in date_filter:
+                before_ts = datetime.strptime(
+                    date_filter['before'], '%Y-%m-%d'
+                ).timestamp()
+                mask &= mtimes < before_ts
+
+        return [f for f, ok in zip(files, mask) if ok]
+
+    def _check_file_filters(
         self,
         file: Path,
-        resolution_filter: Dict[str, int]
+        stat_result: os.stat_result,
+        filters: Dict[str, Any],
+        bounds: Tuple
     ) -> bool:
         """
-        解像度フィルタのチェック（画像ファイルのみ）
+        ファイルが全フィルタ条件を満たすか確認
 
         Args:
             file: ファイルパス
-            resolution_filter: 解像度フィルタ条件（min_width, max_width, min_height, max_height）
+            stat_result: 事前に取得済みのstat結果（サイズ・日付判定で共有）
+            filters: フィルタ条件
+            bounds: _parse_stat_boundsで変換済みのしきい値
 
         Returns:
-            条件を満たす場合True（画像でない場合はスキップ）
+            全条件を満たす場合True
         """
-        try:
-            with Image.open(file) as img:
-                width, height = img.size
-
-                if 'min_width' in resolution_filter:
-                    if width < resolution_filter['min_width']:
-                        return False
+        min_size, max_size, after_ts, before_ts = bounds
 
-                if 'max_width' in resolution_filter:
-                    if width > resolution_filter['max_width']:
-                        return False
-
-                if 'min_height' in resolution_filter:
-                    if height < resolution_filter['min_height']:
-                        return False
+        # サイズフィルタ（パース済みのバイト数と直接比較）
+        if min_size is not None and stat_result.st_size < min_size:
+            return False
+        if max_size is not None and stat_result.st_size > max_size:
+            return False
 
-                if 'max_height' in resolution_filter:
-                    if height > resolution_filter['max_height']:
-                        return False
+        # 日付フィルタ（パース済みのタイムスタンプと直接比較）
+        if after_ts is not None and stat_result.st_mtime < after_ts:
+            return False
+        if before_ts is not None and stat_result.st_mtime >= before_ts:
+            return False
 
-                return True
+        # 安価なサイズ・日付フィルタで不合格ならここまでで弾かれている
+        # 画像系フィルタがなければファイルを開かずに即確定
+        if 'resolution' not in filters and 'aspect_ratio' not in filters:
+            return True
 
-        except Exception as e:
-            # 画像として開けない場合はスキップ（ログに記録）
-            if self.logger:
-                self.logger.warning(
-                    f"{file.name}: 画像として開けませんでした（解像度フィルタをスキップ） - {e}"
-                )
-            return False
+        # 解像度・アスペクト比フィルタ（画像を1回だけ開いて両方判定）
+        return self._check_image_filters(
+            file,
+            filters.get('resolution'),
+            filters.get('aspect_ratio')
+        )
 
-    def _check_aspect_ratio_filter(
+    def _check_image_filters(
         self,
         file: Path,
-        aspect_filter: Dict[str, float]
+        resolution_filter: Dict[str, int] = None,
+        aspect_filter: Dict[str, float] = None
     ) -> bool:
         """
-        アスペクト比フィルタのチェック（画像ファイルのみ）
+        解像度・アスペクト比フィルタのチェック（画像ファイルのみ）
+
+        両フィルタ指定時でもImage.openは1回だけ。サイズ取得のみで
+        ピクセルデコード（load）は発生させない。
 
         Args:
             file: ファイルパス
+            resolution_filter: 解像度フィルタ条件（min_width, max_width, min_height, max_height）
             aspect_filter: アスペクト比フィルタ条件
                           （vertical_min, horizontal_max, square_tolerance）
 
         Returns:
-            条件を満たす場合True（画像でない場合はスキップ）
+            全条件を満たす場合True（画像でない場合はスキップ）
         """
         try:
-            with Image.open(file) as img:
-                width, height = img.size
-                aspect_ratio = height / width  # 縦/横
-
-                # 縦長チェック（vertical_min: 縦横比の最小値）
-                if 'vertical_min' in aspect_filter:
-                    if aspect_ratio < aspect_filter['vertical_min']:
-                        return False
-
-                # 横長チェック（horizontal_max: 縦横比の最大値）
-                if 'horizontal_max' in aspect_filter:
-                    if aspect_ratio > aspect_filter['horizontal_max']:
-                        return False
-
-                # 正方形チェック（square_tolerance: 1.0からの許容範囲）
-                if 'square_tolerance' in aspect_filter:
-                    tolerance = aspect_filter['square_tolerance']
-                    if not (1.0 - tolerance <= aspect_ratio <= 1.0 + tolerance):
-                        return False
-
-                return True
+            width, height = self._image_size(file)
 
         except Exception as e:
             # 画像として開けない場合はスキップ（ログに記録）
             if self.logger:
                 self.logger.warning(
-                    f"{file.name}: 画像として開けませんでした（アスペクト比フィルタをスキップ） - {e}"
+                    f"{file.name}: 画像として開けませんでした（画像フィルタをスキップ） - {e}"
                 )
             return False
+
+        # 解像度チェック
+        if resolution_filter:
+            if 'min_width' in resolution_filter:
+                if width < resolution_filter['min_width']:
+                    return False
+
+            if 'max_width' in resolution_filter:
+                if width > resolution_filter['max_width']:
+                    return False
+
+            if 'min_height' in resolution_filter:
+                if height < resolution_filter['min_height']:
+                    return False
+
+            if 'max_height' in resolution_filter:
+                if height > resolution_filter['max_height']:
+                    return False
+
+        # アスペクト比チェック
+        if aspect_filter:
+            aspect_ratio = height / width  # 縦/横
+
+            # 縦長チェック（vertical_min: 縦横比の最小値）
+            if 'vertical_min' in aspect_filter:
+                if aspect_ratio < aspect_filter['vertical_min']:
+                    return False
+
+            # 横長チェック（horizontal_max: 縦横比の最大値）
+            if 'horizontal_max' in aspect_filter:
+                if aspect_ratio > aspect_filter['horizontal_max']:
+                    return False
+
+            # 正方形チェック（square_tolerance: 1.0からの許容範囲）
+            if 'square_tolerance' in aspect_filter:
+                tolerance = aspect_filter['square_tolerance']
+                if not (1.0 - tolerance <= aspect_ratio <= 1.0 + tolerance):
+                    return False
+
+        return True
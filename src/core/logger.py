@@ -4,6 +4,7 @@
 """
 
 import logging
+import logging.handlers
 from pathlib import Path
 from datetime import datetime
 
@@ -16,6 +17,7 @@ class LootLogger:
     - 日付ごとのログファイル作成
     - ファイル操作の記録
     - コンソール出力との連携
+    - メモリバッファによる書き込みのバッチ化（大量操作時のI/O削減）
     """
 
     def __init__(self, log_directory: str, enable_logging: bool = True):
@@ -59,7 +61,21 @@ class LootLogger:
         )
         file_handler.setFormatter(formatter)
 
-        self.logger.addHandler(file_handler)
+        # メモリバッファ経由で書き込みをバッチ化
+        # （1レコードごとのファイル書き込みを避ける。ERROR時と終了時は即フラッシュ）
+        self._memory_handler = logging.handlers.MemoryHandler(
+            capacity=1024,
+            flushLevel=logging.ERROR,
+            target=file_handler,
+            flushOnClose=True
+        )
+
+        self.logger.addHandler(self._memory_handler)
+
+    def flush(self):
+        """バッファ済みのログレコードをファイルに書き出す"""
+        if self.enable_logging:
+            self._memory_handler.flush()
 
     def info(self, message: str):
         """INFOレベルログ"""
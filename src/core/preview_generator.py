@@ -3,12 +3,23 @@
 プレビュー表示生成
 """
 
+import io
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Dict, Any
 from dataclasses import dataclass
 
 from ..utils.colors import Colors
 
+# 固定の枠線・見出しはインポート時に1回だけ組み立てる
+_PREVIEW_HEADER = (
+    f"{Colors.NEON_CYAN}╔════════════════════════════════════════════╗\n"
+    f"{Colors.NEON_BLUE}║  📋 処理対象プレビュー                    ║\n"
+    f"{Colors.NEON_CYAN}╠════════════════════════════════════════════╣{Colors.RESET}\n"
+    "\n"
+)
+_SEPARATOR_LINE = f"{Colors.CYAN}{'─' * 44}{Colors.RESET}\n"
+
 
 @dataclass
 class FileOperation:
@@ -70,33 +81,26 @@ class PreviewGenerator:
             return self._generate_png_prompt_sort_preview(operations)
 
         # 操作をグループ化（destination別、またはaction別）
-        grouped = self._group_operations(operations, mode)
-
-        # プレビュー生成
-        preview_lines = []
-        preview_lines.append(
-            f"{Colors.NEON_CYAN}╔════════════════════════════════════════════╗"
-        )
-        preview_lines.append(
-            f"{Colors.NEON_BLUE}║  📋 処理対象プレビュー                    ║"
-        )
-        preview_lines.append(
-            f"{Colors.NEON_CYAN}╠════════════════════════════════════════════╣{Colors.RESET}"
-        )
-        preview_lines.append("")
+        # アクション種別の有無もこの1パスで収集する
+        grouped, actions_seen = self._group_operations(operations, mode)
+
+        # プレビュー生成（1行ごとのリスト蓄積＋joinではなくバッファに直接書く）
+        buf = io.StringIO()
+        write = buf.write
+        write(_PREVIEW_HEADER)
 
         # クリーンアップ操作がある場合、対象パターンを表示
-        if mode == "Clean" and any(op.action == 'cleanup' for op in operations):
+        if mode == "Clean" and 'cleanup' in actions_seen:
             cleanup_info = self._get_cleanup_patterns_description()
             if cleanup_info:
-                preview_lines.append(
-                    f"{Colors.NEON_YELLOW}🧹 クリーンアップ対象パターン:{Colors.RESET}"
+                write(
+                    f"{Colors.NEON_YELLOW}🧹 クリーンアップ対象パターン:{Colors.RESET}\n"
                 )
                 for line in cleanup_info:
-                    preview_lines.append(f"{Colors.NEON_CYAN}  {line}{Colors.RESET}")
-                preview_lines.append("")
-                preview_lines.append(f"{Colors.CYAN}{'─' * 44}{Colors.RESET}")
-                preview_lines.append("")
+                    write(f"{Colors.NEON_CYAN}  {line}{Colors.RESET}\n")
+                write("\n")
+                write(_SEPARATOR_LINE)
+                write("\n")
 
         total_count = 0
 
@@ -107,12 +111,12 @@ class PreviewGenerator:
             # グループヘッダー
             if mode == "Sort":
                 action_icon = "📁"
-                header = f"{action_icon} {group_key} ({count}件)"
             else:  # Clean
                 action_icon = self._get_action_icon(group_ops[0].action)
-                header = f"{action_icon} {group_key} ({count}件)"
 
-            preview_lines.append(f"{Colors.NEON_CYAN}{header}{Colors.RESET}")
+            write(
+                f"{Colors.NEON_CYAN}{action_icon} {group_key} ({count}件){Colors.RESET}\n"
+            )
 
             # ファイルリスト表示
             files_to_show = self._select_files_to_show(group_ops)
@@ -120,40 +124,31 @@ class PreviewGenerator:
             for op in files_to_show:
                 # 削除アクションは赤色で強調表示、その他は青色
                 if op.action == 'delete':
-                    preview_lines.append(
-                        f"{Colors.NEON_RED}  ├─ {op.source.name}{Colors.RESET}"
-                    )
+                    write(f"{Colors.NEON_RED}  ├─ {op.source.name}{Colors.RESET}\n")
                 else:
-                    preview_lines.append(
-                        f"{Colors.NEON_BLUE}  ├─ {op.source.name}{Colors.RESET}"
-                    )
+                    write(f"{Colors.NEON_BLUE}  ├─ {op.source.name}{Colors.RESET}\n")
 
             # 省略表示
             omitted = count - len(files_to_show)
             if omitted > 0:
                 if group_ops[0].action == 'delete':
-                    preview_lines.append(
-                        f"{Colors.NEON_RED}  └─ ... 他{omitted}件{Colors.RESET}"
-                    )
+                    write(f"{Colors.NEON_RED}  └─ ... 他{omitted}件{Colors.RESET}\n")
                 else:
-                    preview_lines.append(
-                        f"{Colors.NEON_BLUE}  └─ ... 他{omitted}件{Colors.RESET}"
-                    )
+                    write(f"{Colors.NEON_BLUE}  └─ ... 他{omitted}件{Colors.RESET}\n")
 
-            preview_lines.append("")
+            write("\n")
 
         # サマリー
-        preview_lines.append(f"{Colors.CYAN}{'─' * 44}{Colors.RESET}")
-        preview_lines.append(f"{Colors.NEON_YELLOW}合計: {total_count}件{Colors.RESET}")
-        preview_lines.append("")
+        write(_SEPARATOR_LINE)
+        write(f"{Colors.NEON_YELLOW}合計: {total_count}件{Colors.RESET}\n")
 
-        return "\n".join(preview_lines)
+        return buf.getvalue()
 
     def _group_operations(
         self,
         operations: List[FileOperation],
         mode: str = "Sort"
-    ) -> Dict[str, List[FileOperation]]:
+    ):
         """
         操作をグループ化
 
@@ -162,11 +157,15 @@ class PreviewGenerator:
             mode: モード
 
         Returns:
-            グループ化された操作（key: destination or action）
+            (グループ化された操作（key: destination or action）,
+             出現したアクション種別のset) のタプル
         """
-        grouped = {}
+        grouped = defaultdict(list)
+        actions_seen = set()
 
         for op in operations:
+            actions_seen.add(op.action)
+
             # グループキーの決定
             if op.action == "delete":
                 key = f"削除（{op.reason}）"
@@ -183,12 +182,9 @@ class PreviewGenerator:
             else:
                 key = op.action
 
-            if key not in grouped:
-                grouped[key] = []
-
             grouped[key].append(op)
 
-        return grouped
+        return grouped, actions_seen
 
     def _select_files_to_show(
         self,
@@ -284,27 +280,14 @@ class PreviewGenerator:
         Returns:
             プレビュー文字列
         """
-        preview_lines = []
-        preview_lines.append(
-            f"{Colors.NEON_CYAN}╔════════════════════════════════════════════╗"
-        )
-        preview_lines.append(
-            f"{Colors.NEON_BLUE}║  📋 処理対象プレビュー                    ║"
-        )
-        preview_lines.append(
-            f"{Colors.NEON_CYAN}╠════════════════════════════════════════════╣{Colors.RESET}"
-        )
-        preview_lines.append("")
+        buf = io.StringIO()
+        write = buf.write
+        write(_PREVIEW_HEADER)
 
         # 移動先フォルダでグループ化
-        grouped = {}
+        grouped = defaultdict(list)
         for op in operations:
-            folder_path = op.destination.parent
-            folder_name = folder_path.name
-
-            if folder_name not in grouped:
-                grouped[folder_name] = []
-            grouped[folder_name].append(op)
+            grouped[op.destination.parent.name].append(op)
 
         total_count = 0
 
@@ -315,11 +298,11 @@ class PreviewGenerator:
             # フォルダヘッダー（LoRAワード表示）
             # 最初のoperationからLoRAワードを取得
             first_reason = ops[0].reason
-            preview_lines.append(
+            write(
                 f"{Colors.NEON_CYAN}📁 {folder_name}{Colors.RESET} "
-                f"{Colors.NEON_YELLOW}({first_reason}){Colors.RESET}"
+                f"{Colors.NEON_YELLOW}({first_reason}){Colors.RESET}\n"
             )
-            preview_lines.append(f"{Colors.CYAN}   {count}件{Colors.RESET}")
+            write(f"{Colors.CYAN}   {count}件{Colors.RESET}\n")
 
             # 先頭3件と終端3件を表示
             if count <= 6:
@@ -333,19 +316,14 @@ class PreviewGenerator:
                 # 省略記号の挿入
                 if count > 6 and i == 3:
                     omitted = count - 6
-                    preview_lines.append(
-                        f"{Colors.NEON_BLUE}   ... 他{omitted}件{Colors.RESET}"
-                    )
+                    write(f"{Colors.NEON_BLUE}   ... 他{omitted}件{Colors.RESET}\n")
 
-                preview_lines.append(
-                    f"{Colors.NEON_BLUE}   ├─ {op.source.name}{Colors.RESET}"
-                )
+                write(f"{Colors.NEON_BLUE}   ├─ {op.source.name}{Colors.RESET}\n")
 
-            preview_lines.append("")
+            write("\n")
 
         # サマリー
-        preview_lines.append(f"{Colors.CYAN}{'─' * 44}{Colors.RESET}")
-        preview_lines.append(f"{Colors.NEON_YELLOW}合計: {total_count}件{Colors.RESET}")
-        preview_lines.append("")
+        write(_SEPARATOR_LINE)
+        write(f"{Colors.NEON_YELLOW}合計: {total_count}件{Colors.RESET}\n")
 
-        return "\n".join(preview_lines)
+        return buf.getvalue()
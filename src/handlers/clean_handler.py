@@ -3,8 +3,10 @@
 Clean モードの処理ハンドラー
 """
 
+import itertools
 import re
 import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 from tqdm import tqdm
@@ -12,7 +14,10 @@ from tqdm import tqdm
 from ..core.file_scanner import FileScanner
 from ..core.logger import LootLogger
 from ..core.preview_generator import FileOperation
-from ..utils.file_utils import clean_filename
+from ..utils.file_utils import clean_filename, replace_or_move
+
+# ファイル操作の並列実行数（FS負荷とFD消費を抑えた控えめな値）
+_MAX_EXECUTE_WORKERS = 8
 
 
 class CleanModeHandler:
@@ -49,6 +54,29 @@ class CleanModeHandler:
         self.scanner = scanner
         self.logger = logger
 
+        # 作成済みディレクトリの記録（mkdirの重複呼び出し回避用）
+        self._created_dirs = set()
+
+        # カスタム除去パターンは初期化時に1回だけコンパイル
+        # （ファイルごとの再コンパイルを避ける。不正なパターンは警告して無視）
+        self._custom_patterns = []
+        for pattern in self.config.get('cleanup', {}).get('custom_patterns', []):
+            try:
+                self._custom_patterns.append(re.compile(pattern))
+            except re.error as e:
+                self.logger.warning(f"不正な正規表現パターン '{pattern}': {e}")
+
+    def _ensure_dir(self, directory: Path):
+        """
+        ディレクトリを作成（一度作成したものは記録してスキップ）
+
+        Args:
+            directory: 作成するディレクトリ
+        """
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+
     def plan_operations(self) -> List[FileOperation]:
         """
         実行する操作を計画
@@ -122,20 +150,21 @@ class CleanModeHandler:
         operations = []
         cleanup_config = self.config['cleanup']
         recursive = cleanup_config.get('recursive', True)
-        custom_patterns = cleanup_config.get('custom_patterns', [])
+        custom_patterns = self._custom_patterns  # __init__でコンパイル済み
         pattern = cleanup_config.get('pattern', '*')  # 検索パターン（デフォルト: 全ファイル）
         target_directories = cleanup_config.get('target_directories')  # 対象ディレクトリ（オプション）
 
         # target_directoriesが指定されていれば専用のスキャナーを使用
+        # （リストを実体化せず、走査しながら1件ずつ判定する）
         if target_directories:
             temp_scanner = FileScanner(target_directories, self.logger)
-            matched_files = temp_scanner.scan_files(
+            matched_files = temp_scanner.iter_files(
                 pattern=pattern,
                 recursive=recursive
             )
         else:
             # 指定がなければ全体のtarget_directoryを使用
-            matched_files = self.scanner.scan_files(
+            matched_files = self.scanner.iter_files(
                 pattern=pattern,
                 recursive=recursive
             )
@@ -233,6 +262,10 @@ class CleanModeHandler:
         """
         操作を実行
 
+        削除 → クリーンアップ → 振り分けの順序関係を壊さないよう、
+        アクションの切り替わりごとにフェーズ分割し、各フェーズ内のみ
+        上限付きスレッドプールで並列実行する（ログ・集計はメインスレッド）
+
         Args:
             operations: ファイル操作のリスト
             dry_run: ドライランモード（実際には実行しない）
@@ -243,44 +276,85 @@ class CleanModeHandler:
         success_count = 0
         failure_count = 0
 
-        for op in tqdm(operations, desc="処理中", unit="files"):
-            try:
-                if not dry_run:
-                    if op.action == 'delete':
-                        op.source.unlink()
-
-                    elif op.action == 'cleanup':
-                        op.source.rename(op.destination)
-
-                    elif op.action == 'move':
-                        # destinationがファイルパス（親+ファイル名）かディレクトリパスかを判定
-                        # rename_pattern使用時はdestinationに新しいファイル名が含まれている
-                        if op.destination.suffix:
-                            # 拡張子があればファイルパスと判定
-                            op.destination.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.move(str(op.source), str(op.destination))
-                        else:
-                            # ディレクトリパスと判定
-                            op.destination.mkdir(parents=True, exist_ok=True)
-                            shutil.move(str(op.source), str(op.destination / op.source.name))
-
-                    elif op.action == 'copy':
-                        # destinationがファイルパス（親+ファイル名）かディレクトリパスかを判定
-                        if op.destination.suffix:
-                            # 拡張子があればファイルパスと判定
-                            op.destination.parent.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(str(op.source), str(op.destination))
-                        else:
-                            # ディレクトリパスと判定
-                            op.destination.mkdir(parents=True, exist_ok=True)
-                            shutil.copy2(str(op.source), str(op.destination / op.source.name))
-
-                # ログ記録
+        # tqdmの再描画を間引く（高速なrename連打時に端末出力が律速しないように）
+        progress_kwargs = dict(
+            mininterval=0.2,
+            miniters=max(1, len(operations) // 200)
+        )
+
+        # ドライランはファイル操作なし（ログのみ）
+        if dry_run:
+            for op in tqdm(operations, desc="処理中", unit="files", **progress_kwargs):
                 self.logger.info(f"[{op.action}] {op.source} ({op.reason})")
                 success_count += 1
+            return success_count, failure_count
 
-            except Exception as e:
-                self.logger.error(f"[エラー] {op.source}: {e}")
-                failure_count += 1
+        # スレッドがmkdirで競合しないよう、移動・コピー先を先にまとめて作成
+        for op in operations:
+            if op.action in ('move', 'copy'):
+                if op.destination.suffix:
+                    self._ensure_dir(op.destination.parent)
+                else:
+                    self._ensure_dir(op.destination)
+
+        with tqdm(
+            total=len(operations), desc="処理中", unit="files", **progress_kwargs
+        ) as progress, \
+                ThreadPoolExecutor(max_workers=_MAX_EXECUTE_WORKERS) as executor:
+            for _, phase_ops in itertools.groupby(operations, key=lambda op: op.action):
+                futures = {
+                    executor.submit(self._execute_single, op): op
+                    for op in phase_ops
+                }
+
+                for future in as_completed(futures):
+                    op = futures[future]
+                    try:
+                        future.result()
+                        self.logger.info(f"[{op.action}] {op.source} ({op.reason})")
+                        success_count += 1
+                    except Exception as e:
+                        self.logger.error(f"[エラー] {op.source}: {e}")
+                        failure_count += 1
+                    progress.update(1)
 
         return success_count, failure_count
+
+    def _execute_single(self, op: FileOperation):
+        """
+        1件のファイル操作を実行（ワーカースレッドから呼ばれる）
+
+        Args:
+            op: ファイル操作
+        """
+        if op.action == 'delete':
+            op.source.unlink()
+
+        elif op.action == 'cleanup':
+            op.source.rename(op.destination)
+
+        elif op.action == 'move':
+            # destinationがファイルパス（親+ファイル名）かディレクトリパスかを判定
+            # rename_pattern使用時はdestinationに新しいファイル名が含まれている
+            # 移動は同一FSならrename一発、クロスFSのみコピーにフォールバック
+            if op.destination.suffix:
+                # 拡張子があればファイルパスと判定
+                replace_or_move(op.source, op.destination)
+            else:
+                # ディレクトリパスと判定
+                replace_or_move(op.source, op.destination / op.source.name)
+
+        elif op.action == 'copy':
+            # destinationがファイルパス（親+ファイル名）かディレクトリパスかを判定
+            if op.destination.suffix:
+                # 拡張子があればファイルパスと判定
+                dst_path = op.destination
+            else:
+                # ディレクトリパスと判定
+                dst_path = op.destination / op.source.name
+            # copy2ではなくcopyfile+copystatを使う
+            # （copyfileはカーネル内コピー sendfile/copy_file_range を利用できる。
+            #   copystatがatime/mtime・パーミッション・xattrs(Linux)を維持するため、
+            #   メタデータの保持範囲はcopy2と同等）
+            shutil.copyfile(op.source, dst_path)
+            shutil.copystat(op.source, dst_path)
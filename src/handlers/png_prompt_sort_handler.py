@@ -4,19 +4,161 @@ PNG_Prompt_Sort モードの処理ハンドラー
 AI生成画像をメタデータのLoRA情報で振り分け
 """
 
+import functools
+import itertools
 import os
 import re
-import shutil
+import struct
+import sys
+import types
+import zlib
 import yaml
 import questionary
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Any, Tuple, Optional
+from typing import Iterator, List, Dict, Any, Tuple, Optional
 from tqdm import tqdm
 from PIL import Image
+from PIL.PngImagePlugin import PngImageFile
 
-from ..core.file_scanner import FileScanner
+from ..core.file_scanner import FileScanner, _GLOB_FLAGS
 from ..core.logger import LootLogger
 from ..core.preview_generator import FileOperation
+from ..utils.file_utils import replace_or_move
+
+# libyaml付きビルドならCローダーを使用（純Python実装より5〜10倍高速）
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# LoRA名の正規化用の空白除去テーブル
+# （re.sub(r'\s', '', ...)と同等の文字集合。全角スペース（U+3000）や
+#   NBSP等のUnicode空白も除去対象。C実装のstr.translateは短い文字列に
+#   対する正規表現置換より数倍高速）
+_WS_TABLE = str.maketrans('', '', (
+    ' \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f\x85\xa0'
+    '\u1680\u2000\u2001\u2002\u2003\u2004\u2005\u2006\u2007'
+    '\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000'
+))
+
+# メタデータ抽出の並列実行数（ヘッダ読みのI/O待ちを重ねるための値）
+_MAX_METADATA_WORKERS = min(32, (os.cpu_count() or 4) * 4)
+
+# クロスボリューム移動（コピー+削除）の並列実行数
+_MAX_MOVE_WORKERS = 8
+
+# ストリーミング実行時のバッチサイズ（ピークメモリの上限を決める）
+_STREAM_BATCH_SIZE = 1024
+
+# PNGファイルシグネチャとテキスト系チャンクタイプ
+_PNG_SIGNATURE = b'\x89PNG\r\n\x1a\n'
+_PNG_TEXT_CHUNKS = frozenset((b'tEXt', b'zTXt', b'iTXt'))
+
+
+def _parse_png_text_chunks(image_path: Path) -> Dict[str, str]:
+    """
+    PNGのテキストチャンク（tEXt/zTXt/iTXt）を直接パース
+
+    プロンプト等のテキストはファイル先頭付近のチャンクに格納されて
+    いるため、PILのデコーダ初期化を経由せずチャンクを順に読み、
+    画像データ（IDAT）に到達したら打ち切る。テキスト以外のチャンクは
+    seekで読み飛ばすため、実際に読むのは数KB程度で済む。
+
+    Args:
+        image_path: PNGファイルのパス
+
+    Returns:
+        {キーワード: テキスト} の辞書（img.info相当）
+
+    Raises:
+        ValueError: PNGシグネチャが一致しない場合
+        その他: 破損チャンク等のパース失敗（呼び出し側でPILにフォールバック）
+    """
+    info: Dict[str, str] = {}
+
+    with open(image_path, 'rb', buffering=65536) as fp:
+        if fp.read(8) != _PNG_SIGNATURE:
+            raise ValueError("PNGシグネチャ不一致")
+
+        while True:
+            header = fp.read(8)
+            if len(header) < 8:
+                break
+
+            length, chunk_type = struct.unpack('>I4s', header)
+
+            # 画像データに到達したらテキストチャンクはもう現れない前提で打ち切り
+            if chunk_type == b'IDAT' or chunk_type == b'IEND':
+                break
+
+            if chunk_type not in _PNG_TEXT_CHUNKS:
+                # データ＋CRCをまとめて読み飛ばす
+                fp.seek(length + 4, os.SEEK_CUR)
+                continue
+
+            data = fp.read(length)
+            fp.seek(4, os.SEEK_CUR)  # CRCはスキップ（検証しない）
+
+            if chunk_type == b'tEXt':
+                # keyword \0 text（latin-1）
+                keyword, _, text = data.partition(b'\x00')
+                info[keyword.decode('latin-1')] = text.decode('latin-1')
+
+            elif chunk_type == b'zTXt':
+                # keyword \0 圧縮方式(1byte) 圧縮テキスト
+                keyword, _, rest = data.partition(b'\x00')
+                info[keyword.decode('latin-1')] = (
+                    zlib.decompress(rest[1:]).decode('latin-1')
+                )
+
+            else:  # iTXt
+                # keyword \0 圧縮フラグ(1) 圧縮方式(1) 言語タグ \0 翻訳キーワード \0 テキスト
+                keyword, _, rest = data.partition(b'\x00')
+                compressed = rest[0] == 1
+                rest = rest[2:]
+                _, _, rest = rest.partition(b'\x00')  # 言語タグ
+                _, _, text = rest.partition(b'\x00')  # 翻訳キーワード
+                if compressed:
+                    text = zlib.decompress(text)
+                info[keyword.decode('latin-1')] = text.decode('utf-8')
+
+    return info
+
+
+@functools.lru_cache(maxsize=16)
+def _load_lora_map_cached(path: str, mtime_ns: int) -> types.MappingProxyType:
+    """
+    lora_map.yamlをパースして正規化済みマッピングを返す（メモ化）
+
+    mtime_nsをキーに含めることで、ファイルが編集された場合は
+    自動的にキャッシュミスとなり再パースされる。ハンドラーを
+    何度生成しても同一ファイルのYAMLパースは1回で済む。
+
+    Args:
+        path: マッピングファイルのパス
+        mtime_ns: ファイルの最終更新時刻（ナノ秒）
+
+    Returns:
+        {lora名(小文字・空白除去): フォルダ名} の読み取り専用ビュー
+    """
+    with open(path, 'r', encoding='utf-8') as f:
+        # 一括読み込みした文字列を渡す方がファイルオブジェクトより高速
+        data = yaml.load(f.read(), Loader=_YamlLoader)
+
+    mappings = data.get('mappings', {}) if data else {}
+
+    # 大文字小文字・空白を無視した辞書を作成
+    # （キー・値ともintern済み文字列にしておくと、照合側でも
+    #   internした文字列との辞書参照が同一性比較で即決まる）
+    normalized_map = {}
+    for lora_name, folder_name in mappings.items():
+        # 空白除去＆小文字化
+        key = sys.intern(lora_name.translate(_WS_TABLE).lower())
+        normalized_map[key] = sys.intern(folder_name)
+
+    # キャッシュ共有されるため呼び出し側から変更できない形で返す
+    return types.MappingProxyType(normalized_map)
 
 
 class PngPromptSortModeHandler:
@@ -52,6 +194,23 @@ class PngPromptSortModeHandler:
         # マッピングファイル読み込み
         self.lora_map = self._load_lora_map()
 
+        # ホットループ用にgetメソッドをバインド（毎回の属性参照を省く）
+        self._lora_map_get = self.lora_map.get if self.lora_map is not None else None
+
+        # 正規化済みキーのfrozenset（未登録LoRAが多いコーパスでは
+        # 辞書getより先に軽量なin判定で弾く）
+        self._lora_keys = (
+            frozenset(self.lora_map) if self.lora_map is not None else frozenset()
+        )
+
+        # 作成済みディレクトリの記録（mkdirの重複呼び出し回避用）
+        self._created_dirs = set()
+
+        # 連番生成用の払い出し済みカウンター
+        # （(保存先, ベース名, 拡張子) → 最後に使った連番。
+        #   同名ファイルが大量にあっても毎回1から探索し直さない）
+        self._next_counter: Dict[Tuple[Path, str, str], int] = {}
+
         # メタデータ設定
         self.metadata_config = config.get('metadata', {})
         self.metadata_fields = self.metadata_config.get(
@@ -87,28 +246,48 @@ class PngPromptSortModeHandler:
             return None
 
         try:
-            with open(mapping_file, 'r', encoding='utf-8') as f:
-                data = yaml.safe_load(f)
-
-            mappings = data.get('mappings', {})
-            # 大文字小文字・空白を無視した辞書を作成
-            normalized_map = {}
-            for lora_name, folder_name in mappings.items():
-                # 空白除去＆小文字化
-                key = re.sub(r'\s', '', lora_name).lower()
-                normalized_map[key] = folder_name
+            # mtimeをキーに含めたメモ化ローダー経由で読む
+            # （同じファイルなら再パースされない）
+            lora_map = _load_lora_map_cached(
+                str(mapping_file),
+                mapping_file.stat().st_mtime_ns
+            )
 
-            self.logger.info(f"マッピングファイルを読み込みました: {len(normalized_map)}件")
-            return normalized_map
+            self.logger.info(f"マッピングファイルを読み込みました: {len(lora_map)}件")
+            return lora_map
 
         except Exception as e:
             self.logger.error(f"マッピングファイルの読み込みに失敗: {e}")
             return None
 
+    def _first_metadata_field(self, info: Dict[str, Any]) -> Optional[str]:
+        """
+        画像のinfo辞書から設定済みフィールドの最初の値を取り出す
+
+        Args:
+            info: PILのimg.info相当の辞書
+
+        Returns:
+            メタデータ文字列、該当フィールドがなければNone
+        """
+        for field in self.metadata_fields:
+            if field in info:
+                metadata = info[field]
+                # bytes型の場合はデコード
+                if isinstance(metadata, bytes):
+                    metadata = metadata.decode('utf-8', errors='ignore')
+                return metadata
+        return None
+
     def _extract_metadata(self, image_path: Path) -> Optional[str]:
         """
         画像ファイルからメタデータを抽出
 
+        PNGの場合はテキストチャンクだけを直接パースする（PILの
+        デコーダ初期化を完全にバイパス）。非標準・破損PNGのみ
+        PngImageFile経由のパースにフォールバック。PNG以外は
+        JPEG/WebP対応のため従来どおりImage.open経由で読む。
+
         Args:
             image_path: 画像ファイルのパス
 
@@ -116,59 +295,108 @@ class PngPromptSortModeHandler:
             メタデータ文字列、失敗時はNone
         """
         try:
-            with Image.open(image_path) as img:
-                # 複数フィールドを順番に確認
-                for field in self.metadata_fields:
-                    if field in img.info:
-                        metadata = img.info[field]
-                        # bytes型の場合はデコード
-                        if isinstance(metadata, bytes):
-                            metadata = metadata.decode('utf-8', errors='ignore')
-                        return metadata
-                return None
+            if image_path.suffix.lower() == '.png':
+                try:
+                    # PNG: テキストチャンクのみ直接パース
+                    return self._first_metadata_field(
+                        _parse_png_text_chunks(image_path)
+                    )
+                except Exception:
+                    # 非標準・破損PNGはPILのパーサーで再試行
+                    with open(image_path, 'rb') as fp:
+                        img = PngImageFile(fp)
+                        return self._first_metadata_field(img.info)
+
+            # パスではなくバッファ付きハンドルを渡すことで、PILの細かい
+            # ヘッダreadがシステムコールではなくユーザー空間バッファに当たる
+            with open(image_path, 'rb', buffering=65536) as fh, \
+                    Image.open(fh) as img:
+                return self._first_metadata_field(img.info)
         except Exception as e:
             self.logger.warning(f"メタデータ読み取り失敗 ({image_path.name}): {e}")
             return None
 
-    def _find_loras(self, metadata: str) -> List[str]:
+    def _find_loras(self, metadata: str) -> Iterator[str]:
         """
-        メタデータからLoRA名を抽出
+        メタデータからLoRA名を遅延抽出
+
+        findallと違い全マッチを一度に生成しないため、
+        最初のマッチで打ち切る呼び出し側では余分なスキャンが発生しない
 
         Args:
             metadata: メタデータ文字列
 
-        Returns:
-            検出されたLoRA名のリスト
+        Yields:
+            検出されたLoRA名
+        """
+        for match in self.lora_pattern.finditer(metadata):
+            yield match.group(1)
+
+    def _ensure_dir(self, directory: Path):
         """
-        matches = self.lora_pattern.findall(metadata)
-        return matches
+        ディレクトリを作成（一度作成したものは記録してスキップ）
 
-    def _get_unique_filename(self, dest_dir: Path, filename: str) -> str:
+        Args:
+            directory: 作成するディレクトリ
+        """
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+
+    def _get_unique_filename(
+        self,
+        dest_dir: Path,
+        filename: str,
+        existing_names: set
+    ) -> str:
         """
         重複しないファイル名を生成（連番付与）
 
+        保存先ディレクトリのスナップショット（ファイル名のset）に
+        対して判定するため、候補ごとのexists()システムコールは
+        発生しない。同じベース名の連番は(保存先, ベース名, 拡張子)
+        ごとのカウンターで払い出すため、大量の同名ファイルでも
+        毎回1から探索し直さない。決定した名前はスナップショットにも
+        追加される
+
         Args:
             dest_dir: 保存先ディレクトリ
             filename: 元のファイル名
+            existing_names: 保存先に存在するファイル名のset（更新される）
 
         Returns:
             重複しないファイル名
         """
-        dest_path = dest_dir / filename
-        if not dest_path.exists():
+        if filename not in existing_names:
+            existing_names.add(filename)
             return filename
 
         # 拡張子を分離
         name_part, ext_part = os.path.splitext(filename)
-
-        # 連番を付与
-        counter = 1
-        while True:
-            new_filename = f"{name_part}_{counter}{ext_part}"
-            new_path = dest_dir / new_filename
-            if not new_path.exists():
-                return new_filename
+        counter_key = (dest_dir, name_part, ext_part)
+
+        counter = self._next_counter.get(counter_key)
+        if counter is None:
+            # 初回のみスナップショットから既使用の最大連番を求める
+            suffix_re = re.compile(
+                re.escape(name_part) + r'_(\d+)' + re.escape(ext_part)
+            )
+            counter = 0
+            for name in existing_names:
+                match = suffix_re.fullmatch(name)
+                if match:
+                    counter = max(counter, int(match.group(1)))
+
+        # 次の連番を払い出す（外部で作られた名前との衝突だけsetで再確認）
+        counter += 1
+        new_filename = f"{name_part}_{counter}{ext_part}"
+        while new_filename in existing_names:
             counter += 1
+            new_filename = f"{name_part}_{counter}{ext_part}"
+
+        self._next_counter[counter_key] = counter
+        existing_names.add(new_filename)
+        return new_filename
 
     def plan_operations(self) -> List[FileOperation]:
         """
@@ -177,11 +405,23 @@ class PngPromptSortModeHandler:
         Returns:
             FileOperationのリスト
         """
+        # プレビュー表示用に全件を実体化する
+        return list(self._iter_operations())
+
+    def _iter_operations(self) -> Iterator[FileOperation]:
+        """
+        ファイル操作を遅延生成
+
+        巨大コーパスで全FileOperationを保持しないで済むよう、
+        ディレクトリ単位で列挙→抽出→判定しながら1件ずつyieldする。
+        プレビューが必要な場合はplan_operations経由でリスト化される
+
+        Yields:
+            FileOperation
+        """
         if self.lora_map is None:
             self.logger.error("マッピングファイルが読み込まれていないため、処理を中止します")
-            return []
-
-        operations = []
+            return
 
         # 入力ディレクトリのリストを取得
         source_dirs = self.settings.get('source_directories', [])
@@ -189,18 +429,48 @@ class PngPromptSortModeHandler:
             source_dirs = [source_dirs]
 
         # 出力親ディレクトリ
-        output_dir = Path(self.settings['output_directory'])
+        # ホットループではPath結合（__truediv__）を避け、文字列結合で組み立てる
+        output_dir_str = str(self.settings['output_directory'])
 
-        # 特殊フォルダ名
+        # 特殊フォルダのパスは一度だけ結合しておく
         unknown_folder = self.settings.get('unknown_lora_folder', '__unknown_lora')
         no_lora_folder = self.settings.get('no_lora_folder', '__no_lora_found')
         error_folder = self.settings.get('metadata_error_folder', '__metadata_error')
+        unknown_dir_str = os.path.join(output_dir_str, unknown_folder)
+        no_lora_dir_str = os.path.join(output_dir_str, no_lora_folder)
+        error_dir_str = os.path.join(output_dir_str, error_folder)
+
+        # マッピング先フォルダの結合結果キャッシュ（同じフォルダへの再結合を回避）
+        folder_path_cache: Dict[str, str] = {}
+
+        # 同じLoRA名は多数の画像に繰り返し現れるため、
+        # 生のLoRA名→解決結果（フォルダ名 or None）をメモ化して
+        # 2回目以降の正規化＆照合を辞書参照1回に置き換える
+        resolve_cache: Dict[str, Optional[str]] = {}
 
-        # 対象拡張子
+        # ホットループ用のローカル束縛
+        lora_get = self._lora_map_get
+        lora_keys = self._lora_keys
+
+        # 対象拡張子は1本のコンパイル済み正規表現にまとめる
+        # （リテラル接尾辞の選択肢はreが効率的なマッチャーに落とすため、
+        #   ファイルごとのsplitext+lower+set判定より安い）
         target_extensions = self.settings.get(
             'target_extensions',
             ['png', 'jpg', 'jpeg', 'webp']
         )
+        # 大文字小文字は拡張子ごとのglob列挙と同じプラットフォーム既定に従う
+        ext_re = re.compile(
+            r'\.(?:' + '|'.join(
+                re.escape(ext.lstrip('.')) for ext in target_extensions
+            ) + r')$',
+            _GLOB_FLAGS
+        )
+        ext_match = ext_re.search
+
+        # source_directoriesの重複指定等で同じファイルを二重に計画しないよう、
+        # 処理済みパスを記録する
+        seen_paths: set = set()
 
         # 各入力ディレクトリを処理
         for source_dir_str in source_dirs:
@@ -212,74 +482,96 @@ class PngPromptSortModeHandler:
 
             self.logger.info(f"スキャン中: {source_dir}")
 
-            # このディレクトリ用の一時スキャナーを作成
-            temp_scanner = FileScanner(str(source_dir), self.logger)
-
-            # 拡張子ごとにスキャン
-            for ext in target_extensions:
-                pattern = f"*.{ext}"
-                matched_files = temp_scanner.scan_files(pattern=pattern, recursive=False)
-
-                for file_path in matched_files:
-                    # メタデータ抽出
-                    metadata = self._extract_metadata(file_path)
-
-                    if metadata is None:
-                        # メタデータ読み取り失敗
-                        dest_folder = output_dir / error_folder
-                        operations.append(FileOperation(
-                            source=file_path,
-                            destination=dest_folder / file_path.name,
-                            action='move',
-                            reason='メタデータ読み取り失敗'
-                        ))
+            # 拡張子ごとに再スキャンせず、1回のos.scandirで全対象拡張子を列挙
+            matched_files = []
+            with os.scandir(source_dir) as entries:
+                for entry in entries:
+                    if not ext_match(entry.name) or not entry.is_file():
                         continue
-
-                    # LoRA検出
-                    loras = self._find_loras(metadata)
-
-                    if not loras:
-                        # LoRA未検出
-                        dest_folder = output_dir / no_lora_folder
-                        operations.append(FileOperation(
-                            source=file_path,
-                            destination=dest_folder / file_path.name,
-                            action='move',
-                            reason='LoRA未検出'
-                        ))
+                    file_path = Path(entry.path)
+                    if file_path in seen_paths:
                         continue
-
-                    # マッピング照合
-                    matched_folders = []
-                    for lora_name in loras:
-                        # 正規化
-                        normalized_lora = re.sub(r'\s', '', lora_name).lower()
-
-                        if normalized_lora in self.lora_map:
-                            folder_name = self.lora_map[normalized_lora]
-                            matched_folders.append((folder_name, lora_name))
-
-                    if not matched_folders:
-                        # マッピングにない
-                        dest_folder = output_dir / unknown_folder
-                        operations.append(FileOperation(
-                            source=file_path,
-                            destination=dest_folder / file_path.name,
-                            action='move',
-                            reason=f'未登録LoRA: {loras[0]}'
-                        ))
+                    seen_paths.add(file_path)
+                    matched_files.append(file_path)
+
+            # メタデータ抽出はディスクからのヘッダ読みが支配的なI/Oバウンド処理
+            # なので、抽出フェーズだけスレッドプールで重ねてから順に計画する
+            # （executor.mapは入力順を保持するためzipで対応が取れる）
+            if len(matched_files) > 1:
+                with ThreadPoolExecutor(
+                    max_workers=_MAX_METADATA_WORKERS
+                ) as executor:
+                    metadatas = list(
+                        executor.map(self._extract_metadata, matched_files)
+                    )
+            else:
+                metadatas = [self._extract_metadata(f) for f in matched_files]
+
+            for file_path, metadata in zip(matched_files, metadatas):
+                if metadata is None:
+                    # メタデータ読み取り失敗
+                    yield FileOperation(
+                        source=file_path,
+                        destination=Path(os.path.join(error_dir_str, file_path.name)),
+                        action='move',
+                        reason='メタデータ読み取り失敗'
+                    )
+                    continue
+
+                # LoRA検出＆マッピング照合（最初のマッチで打ち切り）
+                first_lora = None
+                matched = None
+                for lora_name in self._find_loras(metadata):
+                    if first_lora is None:
+                        first_lora = lora_name
+
+                    # 正規化＆照合（初出のLoRA名のみ。以降はメモを引く）
+                    if lora_name in resolve_cache:
+                        folder_name = resolve_cache[lora_name]
                     else:
-                        # 最初のマッチフォルダに移動のみ
-                        folder_name, lora_name = matched_folders[0]
-                        dest_folder = output_dir / folder_name
-                        operations.append(FileOperation(
-                            source=file_path,
-                            destination=dest_folder / file_path.name,
-                            action='move',
-                            reason=f'LoRA: {lora_name}'
-                        ))
-
-        return operations
+                        # internすることで登録済みキーとの比較が同一性判定になる
+                        normalized_lora = sys.intern(
+                            lora_name.translate(_WS_TABLE).lower()
+                        )
+                        if normalized_lora in lora_keys:
+                            folder_name = lora_get(normalized_lora)
+                        else:
+                            folder_name = None
+                        resolve_cache[lora_name] = folder_name
+
+                    if folder_name is not None:
+                        matched = (folder_name, lora_name)
+                        break
+
+                if first_lora is None:
+                    # LoRA未検出
+                    yield FileOperation(
+                        source=file_path,
+                        destination=Path(os.path.join(no_lora_dir_str, file_path.name)),
+                        action='move',
+                        reason='LoRA未検出'
+                    )
+                elif matched is None:
+                    # マッピングにない
+                    yield FileOperation(
+                        source=file_path,
+                        destination=Path(os.path.join(unknown_dir_str, file_path.name)),
+                        action='move',
+                        reason=f'未登録LoRA: {first_lora}'
+                    )
+                else:
+                    # 最初のマッチフォルダに移動のみ
+                    folder_name, lora_name = matched
+                    dest_dir_str = folder_path_cache.get(folder_name)
+                    if dest_dir_str is None:
+                        dest_dir_str = os.path.join(output_dir_str, folder_name)
+                        folder_path_cache[folder_name] = dest_dir_str
+                    yield FileOperation(
+                        source=file_path,
+                        destination=Path(os.path.join(dest_dir_str, file_path.name)),
+                        action='move',
+                        reason=f'LoRA: {lora_name}'
+                    )
 
     def execute_operations(
         self,
@@ -303,25 +595,60 @@ class PngPromptSortModeHandler:
         # 重複処理方法を取得
         duplicate_handling = self.settings.get('duplicate_handling', 'overwrite')
 
+        # 保存先ディレクトリごとのファイル名スナップショット
+        # （重複チェックと連番生成を1回のlistdirで賄い、
+        #   ファイルごとのexists()システムコールをなくす）
+        dir_cache: Dict[Path, set] = {}
+
+        # クロスボリューム移動はコピー+削除になりI/Oバウンドなので、
+        # 後段でまとめてスレッドプール実行する。同一ボリュームの移動は
+        # renameシステムコール1発なのでその場で実行
+        deferred_moves: List[Tuple[FileOperation, Path]] = []
+        dev_cache: Dict[Path, int] = {}
+
+        def _dev_of(directory: Path) -> int:
+            """ディレクトリのデバイス番号（キャッシュ付き）"""
+            dev = dev_cache.get(directory)
+            if dev is None:
+                dev = os.stat(directory).st_dev
+                dev_cache[directory] = dev
+            return dev
+
+        # tqdmの再描画を間引く（高速なrename連打時に端末出力が律速しないように）
+        progress_kwargs = dict(
+            mininterval=0.2,
+            miniters=max(1, len(operations) // 200)
+        )
+
         # 操作実行
-        for op in tqdm(operations, desc="処理中", unit="files"):
+        for op in tqdm(operations, desc="処理中", unit="files", **progress_kwargs):
             try:
                 if not dry_run:
                     # 保存先ディレクトリ作成
-                    op.destination.parent.mkdir(parents=True, exist_ok=True)
+                    self._ensure_dir(op.destination.parent)
 
                     # 重複チェック＆処理
-                    final_dest = op.destination.parent / op.destination.name
-
-                    if final_dest.exists():
-                        if duplicate_handling == 'overwrite':
-                            # 上書き：そのまま移動（既存ファイルが置き換えられる）
-                            pass
-                        elif duplicate_handling == 'sequential':
+                    # overwrite時は事前のexistsチェック不要（os.replaceが上書きする）
+                    final_dest = op.destination
+                    existing_names = None
+
+                    if duplicate_handling != 'overwrite':
+                        dest_parent = op.destination.parent
+                        existing_names = dir_cache.get(dest_parent)
+                        if existing_names is None:
+                            try:
+                                existing_names = set(os.listdir(dest_parent))
+                            except OSError:
+                                existing_names = set()
+                            dir_cache[dest_parent] = existing_names
+
+                    if existing_names is not None and final_dest.name in existing_names:
+                        if duplicate_handling == 'sequential':
                             # 連番付与
                             unique_filename = self._get_unique_filename(
                                 op.destination.parent,
-                                op.destination.name
+                                op.destination.name,
+                                existing_names
                             )
                             final_dest = op.destination.parent / unique_filename
                         elif duplicate_handling == 'ask':
@@ -340,7 +667,8 @@ class PngPromptSortModeHandler:
                             elif answer == "連番付与":
                                 unique_filename = self._get_unique_filename(
                                     op.destination.parent,
-                                    op.destination.name
+                                    op.destination.name,
+                                    existing_names
                                 )
                                 final_dest = op.destination.parent / unique_filename
                             else:  # スキップ
@@ -355,8 +683,17 @@ class PngPromptSortModeHandler:
                             skip_count += 1
                             continue
 
-                    # 移動実行
-                    shutil.move(op.source, final_dest)
+                    # スナップショットにも反映（後続の重複判定用）
+                    if existing_names is not None:
+                        existing_names.add(final_dest.name)
+
+                    # クロスボリュームなら後段の並列フェーズに回す
+                    if _dev_of(op.source.parent) != _dev_of(final_dest.parent):
+                        deferred_moves.append((op, final_dest))
+                        continue
+
+                    # 移動実行（同一FSなのでrename一発）
+                    replace_or_move(op.source, final_dest)
                     self.logger.info(
                         f"移動: {op.source.name} -> "
                         f"{op.destination.parent.name}/{final_dest.name}"
@@ -373,7 +710,71 @@ class PngPromptSortModeHandler:
                 self.logger.error(f"移動失敗 ({op.source.name}): {e}")
                 failure_count += 1
 
+        # クロスボリューム移動をまとめて並列実行
+        # （重複解決・確認プロンプトは上の逐次ループで済んでいる）
+        if deferred_moves:
+            with ThreadPoolExecutor(max_workers=_MAX_MOVE_WORKERS) as executor:
+                futures = {
+                    executor.submit(replace_or_move, op.source, dest): (op, dest)
+                    for op, dest in deferred_moves
+                }
+
+                for future in tqdm(
+                    as_completed(futures),
+                    total=len(deferred_moves),
+                    desc="コピー中",
+                    unit="files",
+                    **progress_kwargs
+                ):
+                    op, dest = futures[future]
+                    try:
+                        future.result()
+                        self.logger.info(
+                            f"移動: {op.source.name} -> "
+                            f"{op.destination.parent.name}/{dest.name}"
+                        )
+                        success_count += 1
+                    except Exception as e:
+                        self.logger.error(f"移動失敗 ({op.source.name}): {e}")
+                        failure_count += 1
+
         if skip_count > 0:
             self.logger.info(f"スキップ: {skip_count}件")
 
         return success_count, failure_count
+
+    def execute_operations_streaming(
+        self,
+        operations: Optional[Iterator[FileOperation]] = None,
+        dry_run: bool = False
+    ) -> Tuple[int, int]:
+        """
+        操作を計画しながらバッチ単位で逐次実行
+
+        plan_operations→execute_operationsの2段構えと違い、
+        全FileOperationを一度に実体化しないため、巨大コーパスでも
+        ピークメモリがバッチサイズで頭打ちになる。プレビュー表示が
+        不要な場合に使用する
+
+        Args:
+            operations: ファイル操作のイテレータ（省略時は_iter_operationsを使用）
+            dry_run: ドライランモード
+
+        Returns:
+            (成功数, 失敗数)
+        """
+        if operations is None:
+            operations = self._iter_operations()
+
+        success_total = 0
+        failure_total = 0
+
+        while True:
+            batch = list(itertools.islice(operations, _STREAM_BATCH_SIZE))
+            if not batch:
+                break
+            success, failure = self.execute_operations(batch, dry_run=dry_run)
+            success_total += success
+            failure_total += failure
+
+        return success_total, failure_total
@@ -3,7 +3,7 @@
 Sort モードの処理ハンドラー
 """
 
-import shutil
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Tuple
 from tqdm import tqdm
@@ -11,6 +11,10 @@ from tqdm import tqdm
 from ..core.file_scanner import FileScanner
 from ..core.logger import LootLogger
 from ..core.preview_generator import FileOperation
+from ..utils.file_utils import replace_or_move
+
+# ファイル操作の並列実行数（FS負荷とFD消費を抑えた控えめな値）
+_MAX_EXECUTE_WORKERS = 8
 
 
 class SortModeHandler:
@@ -41,6 +45,20 @@ class SortModeHandler:
         self.scanner = scanner
         self.logger = logger
 
+        # 作成済みディレクトリの記録（mkdirの重複呼び出し回避用）
+        self._created_dirs = set()
+
+    def _ensure_dir(self, directory: Path):
+        """
+        ディレクトリを作成（一度作成したものは記録してスキップ）
+
+        Args:
+            directory: 作成するディレクトリ
+        """
+        if directory not in self._created_dirs:
+            directory.mkdir(parents=True, exist_ok=True)
+            self._created_dirs.add(directory)
+
     def plan_operations(self) -> List[FileOperation]:
         """
         実行する操作を計画
@@ -52,36 +70,34 @@ class SortModeHandler:
         move_rules = self.config.get('move_rules', [])
         exclusions = self.config.get('exclusions', {})
 
-        # 処理済みファイルを追跡（最初のルールのみ適用）
-        processed_files = set()
-
-        for rule in move_rules:
-            if not rule.get('enabled', True):
-                continue
-
-            pattern = rule['pattern']
-            dest = Path(rule['dest'])
-            description = rule.get('description', pattern)
-            filters = rule.get('filters', {})
-
-            # ファイルをスキャン
-            matched_files = self.scanner.scan_files(
-                pattern=pattern,
-                filters=filters,
-                exclusions=exclusions,
-                recursive=False
-            )
-
-            # 未処理のファイルのみ追加
-            for file in matched_files:
-                if file not in processed_files:
-                    operations.append(FileOperation(
-                        source=file,
-                        destination=dest,
-                        action='move',
-                        reason=description
-                    ))
-                    processed_files.add(file)
+        # 有効なルールのみ対象（定義順＝優先順）
+        active_rules = [rule for rule in move_rules if rule.get('enabled', True)]
+        if not active_rules:
+            return operations
+
+        # ルールごとに再スキャンせず、1回の走査で優先順マッチング
+        # （最初にマッチしたルールのみ適用される）
+        rule_specs = [
+            (rule['pattern'], rule.get('filters', {}))
+            for rule in active_rules
+        ]
+        destinations = [Path(rule['dest']) for rule in active_rules]
+        descriptions = [
+            rule.get('description', rule['pattern'])
+            for rule in active_rules
+        ]
+
+        for rule_idx, file in self.scanner.scan_files_multi(
+            rule_specs,
+            exclusions=exclusions,
+            recursive=False
+        ):
+            operations.append(FileOperation(
+                source=file,
+                destination=destinations[rule_idx],
+                action='move',
+                reason=descriptions[rule_idx]
+            ))
 
         return operations
 
@@ -93,6 +109,9 @@ class SortModeHandler:
         """
         操作を実行
 
+        移動はシステムコール待ちが支配的なため、上限付きの
+        スレッドプールで並列実行する（ログ・集計はメインスレッド）
+
         Args:
             operations: ファイル操作のリスト
             dry_run: ドライランモード（実際には実行しない）
@@ -103,23 +122,51 @@ class SortModeHandler:
         success_count = 0
         failure_count = 0
 
-        for op in tqdm(operations, desc="処理中", unit="files"):
-            try:
-                if not dry_run:
-                    # 移動先ディレクトリを作成
-                    op.destination.mkdir(parents=True, exist_ok=True)
+        # tqdmの再描画を間引く（高速なrename連打時に端末出力が律速しないように）
+        progress_kwargs = dict(
+            mininterval=0.2,
+            miniters=max(1, len(operations) // 200)
+        )
 
-                    # ファイル移動
-                    shutil.move(str(op.source), str(op.destination / op.source.name))
-
-                # ログ記録
+        # ドライランはファイル操作なし（ログのみ）
+        if dry_run:
+            for op in tqdm(operations, desc="処理中", unit="files", **progress_kwargs):
                 self.logger.info(
-                    f"[移動] {op.source} → {op.destination / op.source.name} ({op.reason})"
+                    f"[移動] {op.source} → {op.destination / op.source.name} "
+                    f"({op.reason})"
                 )
                 success_count += 1
-
-            except Exception as e:
-                self.logger.error(f"[エラー] {op.source}: {e}")
-                failure_count += 1
+            return success_count, failure_count
+
+        # スレッドがmkdirで競合しないよう、移動先を先にまとめて作成
+        for op in operations:
+            self._ensure_dir(op.destination)
+
+        def _do_one(op: FileOperation) -> Path:
+            """1件の移動を実行して移動先パスを返す"""
+            dst_path = op.destination / op.source.name
+            replace_or_move(op.source, dst_path)
+            return dst_path
+
+        with ThreadPoolExecutor(max_workers=_MAX_EXECUTE_WORKERS) as executor:
+            futures = {executor.submit(_do_one, op): op for op in operations}
+
+            for future in tqdm(
+                as_completed(futures),
+                total=len(operations),
+                desc="処理中",
+                unit="files",
+                **progress_kwargs
+            ):
+                op = futures[future]
+                try:
+                    dst_path = future.result()
+                    self.logger.info(
+                        f"[移動] {op.source} → {dst_path} ({op.reason})"
+                    )
+                    success_count += 1
+                except Exception as e:
+                    self.logger.error(f"[エラー] {op.source}: {e}")
+                    failure_count += 1
 
         return success_count, failure_count
@@ -149,22 +149,33 @@ class LootManager:
             input(f"{Colors.NEON_CYAN}Enterキーで続行...{Colors.RESET}")
             return
 
-        # 操作を計画
-        operations = handler.plan_operations()
+        # PNG_Prompt_Sortでプレビューを無効化（preview.enabled: false）した
+        # 場合は、計画リストを実体化せず計画しながらバッチ実行する
+        # （巨大コーパスでもピークメモリが一定に保たれる）
+        preview_settings = settings['preview']
+        use_streaming = (
+            preset.mode == "PNG_Prompt_Sort"
+            and not preview_settings.get('enabled', True)
+        )
 
-        if not operations:
-            print(f"{Colors.NEON_YELLOW}処理対象のファイルがありません{Colors.RESET}")
-            input(f"{Colors.NEON_CYAN}Enterキーで続行...{Colors.RESET}")
-            return
+        operations = None
+        if not use_streaming:
+            # 操作を計画
+            operations = handler.plan_operations()
 
-        # プレビュー表示
-        preview_gen = PreviewGenerator(
-            config=config,
-            preview_mode=settings['preview']['mode'],
-            preview_count=settings['preview']['count']
-        )
-        preview = preview_gen.generate_preview(operations, preset.mode)
-        print(preview)
+            if not operations:
+                print(f"{Colors.NEON_YELLOW}処理対象のファイルがありません{Colors.RESET}")
+                input(f"{Colors.NEON_CYAN}Enterキーで続行...{Colors.RESET}")
+                return
+
+            # プレビュー表示
+            preview_gen = PreviewGenerator(
+                config=config,
+                preview_mode=preview_settings['mode'],
+                preview_count=preview_settings['count']
+            )
+            preview = preview_gen.generate_preview(operations, preset.mode)
+            print(preview)
 
         # 実行確認
         if settings.get('confirm_before_execute', True):
@@ -189,7 +200,13 @@ class LootManager:
         if dry_run:
             print(f"{Colors.NEON_YELLOW}[ドライランモード] 実際にはファイル操作を行いません{Colors.RESET}")
 
-        success, failure = handler.execute_operations(operations, dry_run=dry_run)
+        if use_streaming:
+            success, failure = handler.execute_operations_streaming(dry_run=dry_run)
+        else:
+            success, failure = handler.execute_operations(operations, dry_run=dry_run)
+
+        # バッファ済みログを書き出し
+        logger.flush()
 
         # 結果サマリー
         print()
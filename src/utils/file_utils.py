@@ -3,16 +3,62 @@
 ファイル操作用のユーティリティ関数
 """
 
+import errno
+import functools
 import os
 import re
+import shutil
 import logging
 from typing import List
 
+# デフォルト除去パターン: 絵文字、特殊記号（Unicode範囲）
+# 呼び出しごとの再コンパイルを避けるためモジュールレベルで1回だけ構築
+_EMOJI_RE = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # 顔文字
+    "\U0001F300-\U0001F5FF"  # シンボル＆絵文字
+    "\U0001F680-\U0001F6FF"  # 乗り物＆地図シンボル
+    "\U0001F1E0-\U0001F1FF"  # 国旗
+    "\U00002702-\U000027B0"  # 装飾記号
+    "\U0001F200-\U0001F251"  # 囲み文字（修正: U+1F200～、日本語を除外）
+    "]+",
+    flags=re.UNICODE
+)
+
+# 連続する空白の統合用
+_MULTISPACE_RE = re.compile(r'\s+')
+
+
+@functools.lru_cache(maxsize=None)
+def _compile_user(pattern: str):
+    """
+    カスタム除去パターンをコンパイル（メモ化）
+
+    不正なパターンは警告してNoneを返す（以降の呼び出しもキャッシュヒット）
+    """
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        logging.warning(f"不正な正規表現パターン '{pattern}': {e}")
+        return None
+
+
+# サイズ単位の変換テーブル（大きい単位から順にチェック）
+_UNITS = (
+    ('TB', 1024 ** 4),
+    ('GB', 1024 ** 3),
+    ('MB', 1024 ** 2),
+    ('KB', 1024),
+)
+
 
 def parse_file_size(size_str: str) -> int:
     """
     ファイルサイズ文字列をバイト数に変換
 
+    設定ファイル由来の少数の文字列が何度も渡されるため、
+    文字列のパース結果はメモ化される
+
     Args:
         size_str: サイズ文字列（例: "10MB", "1.5GB", "1024"）
 
@@ -22,17 +68,16 @@ def parse_file_size(size_str: str) -> int:
     if isinstance(size_str, int):
         return size_str
 
-    size_str = str(size_str).strip().upper()
+    return _parse_file_size_str(str(size_str))
+
+
+@functools.lru_cache(maxsize=64)
+def _parse_file_size_str(size_str: str) -> int:
+    """文字列形式のサイズをバイト数に変換（メモ化済み）"""
+    size_str = size_str.strip().upper()
 
     # 単位の抽出
-    units = {
-        'KB': 1024,
-        'MB': 1024 ** 2,
-        'GB': 1024 ** 3,
-        'TB': 1024 ** 4,
-    }
-
-    for unit, multiplier in units.items():
+    for unit, multiplier in _UNITS:
         if size_str.endswith(unit):
             number_part = size_str[:-len(unit)].strip()
             try:
@@ -47,6 +92,26 @@ def parse_file_size(size_str: str) -> int:
         raise ValueError(f"不正なサイズ形式: {size_str}")
 
 
+def replace_or_move(source, destination):
+    """
+    ファイルを移動（同一ファイルシステムなら単一のrenameシステムコール）
+
+    os.replaceは移動先が既に存在しても上書きするため、
+    事前のexistsチェックが不要になる。ファイルシステムをまたぐ
+    移動（EXDEV）のみshutil.moveのコピー処理にフォールバック。
+
+    Args:
+        source: 移動元パス
+        destination: 移動先パス（ファイル名を含む）
+    """
+    try:
+        os.replace(source, destination)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source), str(destination))
+
+
 def format_file_size(size_bytes: int) -> str:
     """
     バイト数を人間が読みやすい形式に変換
@@ -78,31 +143,22 @@ def clean_filename(filename: str, custom_patterns: List[str] = None) -> str:
     # 拡張子を分離
     name_part, ext_part = os.path.splitext(filename)
 
-    # デフォルトパターン: 絵文字、特殊記号の除去
-    # 基本的な絵文字範囲（Unicode範囲）
-    emoji_pattern = re.compile(
-        "["
-        "\U0001F600-\U0001F64F"  # 顔文字
-        "\U0001F300-\U0001F5FF"  # シンボル＆絵文字
-        "\U0001F680-\U0001F6FF"  # 乗り物＆地図シンボル
-        "\U0001F1E0-\U0001F1FF"  # 国旗
-        "\U00002702-\U000027B0"  # 装飾記号
-        "\U0001F200-\U0001F251"  # 囲み文字（修正: U+1F200～、日本語を除外）
-        "]+",
-        flags=re.UNICODE
-    )
-    name_part = emoji_pattern.sub('', name_part)
+    # デフォルトパターン: 絵文字、特殊記号の除去（モジュールレベルで事前コンパイル済み）
+    name_part = _EMOJI_RE.sub('', name_part)
 
     # カスタムパターンの適用
+    # （コンパイル済みパターンも受け付ける。文字列の場合もメモ化コンパイル
+    #   されるため、ファイルごとの再コンパイルは発生しない）
     if custom_patterns:
         for pattern in custom_patterns:
-            try:
-                name_part = re.sub(pattern, '', name_part)
-            except re.error as e:
-                logging.warning(f"不正な正規表現パターン '{pattern}': {e}")
+            if not isinstance(pattern, re.Pattern):
+                pattern = _compile_user(pattern)
+                if pattern is None:
+                    continue
+            name_part = pattern.sub('', name_part)
 
     # 連続する空白を1つに統合
-    name_part = re.sub(r'\s+', ' ', name_part)
+    name_part = _MULTISPACE_RE.sub(' ', name_part)
 
     # 前後の空白を削除（拡張子の前のスペースも含む）
     name_part = name_part.strip()